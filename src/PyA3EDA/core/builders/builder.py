@@ -95,13 +95,67 @@ to generate the Q-Chem input file content before writing them to disk.
 
 from pathlib import Path
 import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from itertools import combinations
-from PyA3EDA.core.utils.file_utils import read_text, write_text
+from typing import FrozenSet, NamedTuple
+from PyA3EDA.core.utils.file_utils import read_template, read_text, write_text
 from PyA3EDA.core.builders.molecule_builder import (
     build_standard_molecule_section, build_fragmented_molecule_section)
 from PyA3EDA.core.builders import rem_builder
 
 
+class InputFileInfo(NamedTuple):
+    """An input file path paired with its metadata, as yielded by iter_input_paths."""
+    path: Path
+    metadata: dict
+
+
+@lru_cache(maxsize=None)
+def _list_template_dir(templates_dir: str) -> FrozenSet[str]:
+    """
+    Returns the entry names of a template directory, read once with os.scandir.
+    Cached so that template lookups are set membership tests instead of one
+    exists() call per candidate file; cleared at the start of each generation run.
+    """
+    try:
+        with os.scandir(templates_dir) as entries:
+            return frozenset(entry.name for entry in entries)
+    except OSError as e:
+        logging.debug(f"Could not list template directory {templates_dir}: {e}")
+        return frozenset()
+
+
+@lru_cache(maxsize=None)
+def _casefolded_template_names(templates_dir: str) -> FrozenSet[str]:
+    """Case-folded entry names of a template directory, cleared together with _list_template_dir."""
+    return frozenset(name.casefold() for name in _list_template_dir(templates_dir))
+
+
+def _template_exists(templates_dir: str, file_name: str) -> bool:
+    """
+    Checks for a template file via the cached directory listing. The listing is case-sensitive
+    while file lookups are not on case-insensitive filesystems (macOS, Windows), so a name that
+    only matches with different case is confirmed with os.path.exists.
+    """
+    if file_name in _list_template_dir(templates_dir):
+        return True
+    if file_name.casefold() in _casefolded_template_names(templates_dir):
+        return os.path.exists(os.path.join(templates_dir, file_name))
+    return False
+
+
+@lru_cache(maxsize=None)
+def _ensure_directory(directory: str) -> None:
+    """
+    Creates directory (with parents) once per generation run. Many input files share
+    the same folder, so later calls are cache hits instead of repeated mkdir syscalls;
+    failures raise and are retried on the next call. Cleared with the template listing.
+    """
+    Path(directory).mkdir(parents=True, exist_ok=True)
+
+
 def get_molecule_section(molecule_processing_fn, species: str, template_prefix: str = "",
                          catalyst: str = None, mode: str = "opt", 
                          opt_output_path: Path = None, system_dir: Path = None, 
@@ -124,13 +178,13 @@ def get_molecule_section(molecule_processing_fn, species: str, template_prefix:
     """
     def load_xyz(identifier: str) -> str:
         """Load XYZ template, trying calc_type-specific version first."""
-        templates_dir = system_dir / "templates" / "molecule"
+        templates_dir = os.path.join(system_dir, "templates", "molecule")
         for suffix in ([f"_{calc_type}", ""] if calc_type else [""]):
-            path = templates_dir / f"{identifier}{suffix}.xyz"
-            if path.exists() and (content := read_text(path)):
+            file_name = f"{identifier}{suffix}.xyz"
+            if _template_exists(templates_dir, file_name) and (content := read_template(os.path.join(templates_dir, file_name))):
                 return content
         # Only log error if no template found at all (after trying all suffixes)
-        logging.error(f"Missing template: {templates_dir / f'{identifier}.xyz'}")
+        logging.error(f"Missing template: {os.path.join(templates_dir, f'{identifier}.xyz')}")
         return None
     
     # Load the main composite/species template
@@ -169,6 +223,13 @@ def get_molecule_section(molecule_processing_fn, species: str, template_prefix:
         return molecule_processing_fn(composite_xyz_text, unique_id, output_text)
 
 
+def _count_lines(text: str) -> int:
+    """Counts the lines of "\n"-separated text like len(text.splitlines()), without building the list."""
+    if not text:
+        return 0
+    return text.count("\n") + (not text.endswith("\n"))
+
+
 def get_rem_section(system_dir: Path, calc: str, rem: dict, category: str, branch: str,
                     mode: str, method: str, basis: str) -> str:
     """
@@ -190,7 +251,8 @@ def get_rem_section(system_dir: Path, calc: str, rem: dict, category: str, branc
             eda2, scfmi_freeze_ss, eda_bsse
         )
     else:
-        jobtype = "ts" if branch == "ts" else ("sp" if len(rem.get("molecule_section", "").splitlines()) - 1 == 1 else "opt")
+        # A single atom (charge/multiplicity line plus one coordinate line) cannot be optimized
+        jobtype = "ts" if branch == "ts" else ("sp" if _count_lines(rem.get("molecule_section", "")) - 1 == 1 else "opt")
         return rem_builder.build_rem_section_for_opt(
             system_dir, calc, rem["method"], basis,
             rem.get("dispersion", "false"), rem.get("solvent", "false"), jobtype
@@ -225,52 +287,36 @@ def build_file_path(system_dir: Path, method: str, basis: str, dispersion: str,
   
     # Create base folder name using the centralized function
     base_folder_name = build_method_folder_name(top_method, top_basis, top_disp, top_solvent)
-    base_folder = system_dir / base_folder_name
   
+    # Folder components below the base folder and the file stem (without suffix)
     if category == "no_cat":
         if branch in ("reactants", "products"):
-            if mode == "opt":
-                relative = Path("no_cat") / branch / species / f"{species}{suffix}"
-            else:
-                relative = Path("no_cat") / branch / species / sp_folder / f"{species}{suffix}"
+            folders, stem = ("no_cat", branch, species), species
         elif branch == "ts":
-            if mode == "opt":
-                relative = Path("no_cat") / "ts" / f"tscomplex{suffix}"
-            else:
-                relative = Path("no_cat") / "ts" / sp_folder / f"tscomplex{suffix}"
+            folders, stem = ("no_cat", "ts"), "tscomplex"
         else:
             raise ValueError(f"Unknown branch for no_cat: {branch}")
     elif category == "cat":
         if not catalyst_name:
             raise ValueError("For catalyst cases, catalyst_name must be provided.")
         
-        if branch == "preTS":
-            if mode == "opt":
-                relative = Path(catalyst_name) / "preTS" / species / calc_type / f"preTS_{species}_{calc_type}{suffix}"
-            else:
-                relative = Path(catalyst_name) / "preTS" / species / calc_type / sp_folder / f"preTS_{species}_{calc_type}{suffix}"
-        elif branch == "postTS":
-            if mode == "opt":
-                relative = Path(catalyst_name) / "postTS" / species / calc_type / f"postTS_{species}_{calc_type}{suffix}"
-            else:
-                relative = Path(catalyst_name) / "postTS" / species / calc_type / sp_folder / f"postTS_{species}_{calc_type}{suffix}"
+        if branch in ("preTS", "postTS"):
+            folders, stem = (catalyst_name, branch, species, calc_type), f"{branch}_{species}_{calc_type}"
         elif branch == "ts":
-            if mode == "opt":
-                relative = Path(catalyst_name) / "ts" / calc_type / f"ts_{catalyst_name}-tscomplex_{calc_type}{suffix}"
-            else:
-                relative = Path(catalyst_name) / "ts" / calc_type / sp_folder / f"ts_{catalyst_name}-tscomplex_{calc_type}{suffix}"
+            folders, stem = (catalyst_name, "ts", calc_type), f"ts_{catalyst_name}-tscomplex_{calc_type}"
         elif branch == "cat":
-            if mode == "opt":
-                relative = Path(catalyst_name) / "cat" / f"{catalyst_name}{suffix}"
-            else:
-                relative = Path(catalyst_name) / "cat" / sp_folder / f"{catalyst_name}{suffix}"
+            folders, stem = (catalyst_name, "cat"), catalyst_name
         else:
             raise ValueError(f"Unknown branch for catalyst: {branch}")
     else:
         raise ValueError(f"Unknown category: {category}")
   
-    full_path = base_folder / relative
-    return full_path
+    # SP files live in an extra subfolder next to the OPT file
+    if mode == "sp":
+        folders += (sp_folder,)
+    
+    # Join everything as plain strings and create a single Path at the end
+    return Path(os.sep.join((os.fspath(system_dir), base_folder_name, *folders, f"{stem}{suffix}")))
 
 def build_and_write_input_file(system_dir: Path,
                                sanitized: dict,
@@ -366,15 +412,18 @@ def build_and_write_input_file(system_dir: Path,
         logging.info(f"Overwriting file ({reason}): {file_path.relative_to(system_dir)}")
     
     # Load base template
-    base_template = read_text(template_base_path)
+    base_template = read_template(template_base_path)
     if not base_template:
         logging.error(f"Failed to read template: {template_base_path}")
         return
         
+    # Template paths are joined as plain strings; read_template and the listing cache take them as-is
+    rem_dir = os.path.join(system_dir, "templates", "rem")
+    
     # Add geom opt section for opt mode
     if mode == "opt":
-        geom_file = system_dir / "templates" / "rem" / "geom_opt.rem"
-        geom_content = read_text(geom_file)
+        geom_file = os.path.join(rem_dir, "geom_opt.rem")
+        geom_content = read_template(geom_file)
         if geom_content:
             base_template += "\n\n" + geom_content
         else:
@@ -383,9 +432,10 @@ def build_and_write_input_file(system_dir: Path,
     # Add solvent REM section if solvent is specified
     if sanitized["solvent"] and sanitized["solvent"].lower() != "false":
         solvent_name = sanitized["solvent"]
-        solvent_file = system_dir / "templates" / "rem" / f"solvent_{solvent_name}.rem"
-        if solvent_file.exists():
-            solvent_content = read_text(solvent_file)
+        solvent_file_name = f"solvent_{solvent_name}.rem"
+        solvent_file = os.path.join(rem_dir, solvent_file_name)
+        if _template_exists(rem_dir, solvent_file_name):
+            solvent_content = read_template(solvent_file)
             if solvent_content:
                 base_template += "\n\n" + solvent_content
         else:
@@ -445,7 +495,7 @@ def build_and_write_input_file(system_dir: Path,
         return
     
     # Write the file
-    file_path.parent.mkdir(parents=True, exist_ok=True)
+    _ensure_directory(os.path.dirname(file_path))
     if write_text(file_path, content):
         logging.info(f"Input file written to {file_path.relative_to(system_dir)}")
     else:
@@ -461,10 +511,12 @@ def get_combinations(species_list, min_length=2):
             yield "-".join(spec["name"]["opt"] for spec in combo)
 
 
+@lru_cache(maxsize=1024)
 def build_method_folder_name(method: str, basis: str, dispersion: str, solvent: str) -> str:
     """
     Build a method folder name by filtering out 'false' values.
     Used consistently for both OPT and SP folder naming.
+    Memoized, as every input file path of a method combination rebuilds the same name.
     """
     folder_parts = [method]
     
@@ -485,7 +537,7 @@ def build_method_folder_name(method: str, basis: str, dispersion: str, solvent:
 
 def create_file_metadata(method: dict, basis_set: dict, mode: str, category: str, 
                         branch: str, species: str, calc_type: str, catalyst: str,
-                        file_path: Path, config_manager=None) -> dict:
+                        file_path: Path, config_manager=None, all_components: dict = None) -> dict:
     """
     Create comprehensive, standardized metadata for calculation files.
     
@@ -500,6 +552,8 @@ def create_file_metadata(method: dict, basis_set: dict, mode: str, category: str
         catalyst: Catalyst name (empty string if none)
         file_path: Path to the calculation file
         config_manager: Optional config manager for component lists
+        all_components: Optional precomputed result of _collect_reaction_components,
+            so the complete component lists are not rebuilt for every file
         
     Returns:
         Comprehensive metadata dictionary with all available information
@@ -526,7 +580,7 @@ def create_file_metadata(method: dict, basis_set: dict, mode: str, category: str
     # Component information from config manager
     component_metadata = {}
     if config_manager:
-        component_metadata = _get_reaction_components(config_manager, species, catalyst)
+        component_metadata = _get_reaction_components(config_manager, species, catalyst, all_components)
     
     # Combine all metadata
     return {
@@ -586,14 +640,25 @@ def _get_computational_metadata(method: dict, basis_set: dict, mode: str) -> dic
         }
 
 
-def _get_reaction_components(config_manager, species: str, catalyst: str) -> dict:
+def _collect_reaction_components(config: dict) -> dict:
+    """Collect the complete reactant, product and catalyst name lists from the builder config."""
+    return {
+        "all_reactants": [r["name"]["opt"] for r in config.get("reactants", [])],
+        "all_products": [p["name"]["opt"] for p in config.get("products", [])],
+        "all_catalysts": [c["name"]["opt"] for c in config.get("catalysts", [])]
+    }
+
+
+def _get_reaction_components(config_manager, species: str, catalyst: str,
+                             all_components: dict = None) -> dict:
     """Extract comprehensive reaction component metadata from config manager."""
-    config = config_manager.get_builder_config()
+    if all_components is None:
+        all_components = _collect_reaction_components(config_manager.get_builder_config())
     
     # Get complete reaction components
-    all_reactants = [r["name"]["opt"] for r in config.get("reactants", [])]
-    all_products = [p["name"]["opt"] for p in config.get("products", [])]
-    all_catalysts = [c["name"]["opt"] for c in config.get("catalysts", [])]
+    all_reactants = all_components["all_reactants"]
+    all_products = all_components["all_products"]
+    all_catalysts = all_components["all_catalysts"]
     
     # Filter to components present in this specific calculation
     present_reactants = [r for r in all_reactants if r in species]
@@ -631,6 +696,8 @@ def process_input_files(config_manager, system_dir: Path, mode: str = "generate"
     templates_dir = system_dir / "templates"
     base_template_path = templates_dir / "base_template.in"
     processed_config = config_manager.get_builder_config() if hasattr(config_manager, 'get_builder_config') else config_manager
+    # Complete component lists are identical for every file, so collect them once per run
+    all_components = _collect_reaction_components(processed_config)
 
     # Keep track of OPT files already processed to avoid duplicates
     processed_opt_files = set()
@@ -673,14 +740,12 @@ def process_input_files(config_manager, system_dir: Path, mode: str = "generate"
                 }
             )
         
-        # Create metadata
-        metadata = create_file_metadata(method, bs, file_mode, category, branch, 
-                                    species, calc_type, catalyst_name, file_path, config_manager)
-        
-        # For yield mode, return path with metadata
+        # For yield mode, return path with metadata (only built here; generation does not use it)
         if mode == "yield":
-            from types import SimpleNamespace
-            return SimpleNamespace(path=file_path, metadata=metadata)
+            metadata = create_file_metadata(method, bs, file_mode, category, branch, 
+                                        species, calc_type, catalyst_name, file_path, config_manager,
+                                        all_components)
+            return InputFileInfo(file_path, metadata)
         
         # For generate mode, build and write the file
         sanitized, original = config_manager.get_common_values(method, bs, file_mode)
@@ -803,8 +868,32 @@ def process_input_files(config_manager, system_dir: Path, mode: str = "generate"
         logging.info("Input file generation completed.")
 
 
+def _warm_template_cache(system_dir: Path, max_workers: int = 8) -> None:
+    """
+    Reads the base template and all molecule/REM templates concurrently into the
+    read_template cache, so generation does not wait on one template read at a time
+    (noticeable on network filesystems). Paths are built exactly as the builders build them.
+    """
+    templates_dir = os.path.join(system_dir, "templates")
+    template_paths = [Path(templates_dir, "base_template.in")]
+    for subdir, suffix in (("molecule", ".xyz"), ("rem", ".rem")):
+        subdir_path = os.path.join(templates_dir, subdir)
+        template_paths.extend(
+            os.path.join(subdir_path, name) for name in sorted(_list_template_dir(subdir_path))
+            if name.endswith(suffix)
+        )
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        list(pool.map(read_template, template_paths))
+
+
 def generate_all_inputs(config_manager, system_dir: Path, overwrite: str = None, sp_strategy: str = "smart") -> None:
     """Generate all Q-Chem input files using the unified config from config_manager."""
+    # Pick up template files and directories added, removed or edited since a previous run
+    _list_template_dir.cache_clear()
+    _casefolded_template_names.cache_clear()
+    read_template.cache_clear()
+    _ensure_directory.cache_clear()
+    _warm_template_cache(system_dir)
     list(process_input_files(config_manager, system_dir, "generate", overwrite, sp_strategy))
 
 
@@ -821,7 +910,7 @@ def iter_input_paths(config, system_dir: Path, include_metadata: bool = False):
         include_metadata: Whether to include metadata with paths
         
     Yields:
-        Path objects (if include_metadata=False) or SimpleNamespace objects 
+        Path objects (if include_metadata=False) or InputFileInfo tuples 
         with 'path' and 'metadata' attributes (if include_metadata=True)
     """
     # Use the existing process_input_files function in yield mode
@@ -1,7 +1,8 @@
+import os
 from pathlib import Path
-from PyA3EDA.core.utils.file_utils import read_text
+from PyA3EDA.core.utils.file_utils import read_template
 
-def _get_calc_type_rem(rem_dir: Path, calc_type: str) -> str:
+def _get_calc_type_rem(rem_dir: str, calc_type: str) -> str:
     """Helper function to get REM fragment for a specific calc_type."""
     mapping = {
         "full_cat": "rem_full_cat.rem",
@@ -11,11 +12,11 @@ def _get_calc_type_rem(rem_dir: Path, calc_type: str) -> str:
     rem_file = mapping.get(calc_type)
     if not rem_file:
         raise ValueError(f"Unknown calc_type: {calc_type}")
-    return read_text(rem_dir / rem_file)
+    return read_template(os.path.join(rem_dir, rem_file))
 
-def _build_rem_template(base_template_path: Path, calc_type: str = None, rem_dir: Path = None) -> str:
+def _build_rem_template(base_template_path: str, calc_type: str = None, rem_dir: str = None) -> str:
     """Helper function to build a REM template by combining base and calc-type specific templates."""
-    base_rem = read_text(base_template_path)
+    base_rem = read_template(base_template_path)
     
     if calc_type and rem_dir:
         specific_rem = _get_calc_type_rem(rem_dir, calc_type)
@@ -29,8 +30,8 @@ def build_rem_section_for_calc_type(system_dir: Path, calc_type: str, method_nam
     Builds and returns the fully formatted REM section
     by combining the base REM template with a specific REM template based on the calc_type.
     """
-    rem_dir = system_dir / "templates" / "rem"
-    base_path = rem_dir / "rem_base.rem"
+    rem_dir = os.path.join(system_dir, "templates", "rem")
+    base_path = os.path.join(rem_dir, "rem_base.rem")
     
     template = _build_rem_template(base_path, calc_type, rem_dir)
     
@@ -48,8 +49,8 @@ def build_rem_section_for_opt(system_dir: Path, calc_type: str, method: str,
       - If calc_type is specified, appends the corresponding REM file.
     Substitutions include: method, basis, dispersion, jobtype, and solvent.
     """
-    rem_dir = system_dir / "templates" / "rem"
-    base_path = rem_dir / "rem_opt_base.rem"
+    rem_dir = os.path.join(system_dir, "templates", "rem")
+    base_path = os.path.join(rem_dir, "rem_opt_base.rem")
     
     template = _build_rem_template(base_path, calc_type, rem_dir)
     
@@ -65,8 +66,8 @@ def build_rem_section_for_sp(system_dir: Path, method: str, basis: str,
     Uses rem_sp_eda_base.rem as the base REM template.
     Substitutions include: method, basis, dispersion, solvent, eda2, scfmi_freeze_ss, and eda_bsse.
     """
-    rem_dir = system_dir / "templates" / "rem"
-    base_path = rem_dir / "rem_sp_eda_base.rem"
+    rem_dir = os.path.join(system_dir, "templates", "rem")
+    base_path = os.path.join(rem_dir, "rem_sp_eda_base.rem")
     
     # Load the template
     template = _build_rem_template(base_path)
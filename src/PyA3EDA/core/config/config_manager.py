@@ -12,6 +12,12 @@ from pathlib import Path
 from typing import Any, Dict, Tuple
 from PyA3EDA.core.utils.file_utils import sanitize_filename
 
+# Prefer the libyaml-backed loader; fall back to the pure-Python one if PyYAML was built without it
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
 
 class ConfigManager:
     def __init__(self, config_path: str) -> None:
@@ -29,8 +35,7 @@ class ConfigManager:
         if not config_file.is_file():
             raise FileNotFoundError(f"Configuration file not found: {config_path}")
         try:
-            with config_file.open(encoding="utf-8") as f:
-                return yaml.safe_load(f)
+            return yaml.load(config_file.read_bytes(), Loader=_YamlLoader)
         except yaml.YAMLError as e:
             raise ValueError(f"Error parsing YAML configuration: {e}")
 
@@ -48,3 +48,5 @@ class Constants:
         '$': '-dollar-', '~': '-tilde-', '!': '-exclamation-', '=': '-equal-',
         '\t': '-tab-', '\n': '-newline-',
     }
+    # Single-pass translation table for ESCAPE_MAP (all keys are single characters)
+    ESCAPE_TRANSLATION = str.maketrans(ESCAPE_MAP)
@@ -5,8 +5,9 @@ Pure file writers for direct CSV and XYZ export:
 - write_csv_data: Generic CSV writer with configurable data type for logging
 - write_xyz_files: Write XYZ coordinate files
 """
+import csv
+import io
 import logging
-import pandas as pd
 from pathlib import Path
 from typing import Dict, List, Optional, Any
 
@@ -30,11 +31,18 @@ def write_csv_data(data_list: List[Dict[str, Any]], file_path: Path, data_type:
         return False
         
     try:
-        # Create DataFrame and save directly
-        df = pd.DataFrame(data_list)
+        # Columns are the union of all keys in first-appearance order; missing values stay empty
+        fieldnames = list(dict.fromkeys(key for data in data_list for key in data))
+        # Render the whole CSV in memory and hand it to the filesystem in a single write.
+        # Fieldnames cover every key, so the per-row extra-key check can be skipped.
+        buffer = io.StringIO()
+        writer = csv.DictWriter(buffer, fieldnames=fieldnames, lineterminator="\n", extrasaction="ignore")
+        writer.writeheader()
+        writer.writerows(data_list)
         file_path.parent.mkdir(parents=True, exist_ok=True)
-        df.to_csv(file_path, index=False)
-        logging.info(f"Saved {len(df)} {data_type} rows to {file_path}")
+        if not write_text(file_path, buffer.getvalue()):
+            return False
+        logging.info(f"Saved {len(data_list)} {data_type} rows to {file_path}")
         return True
         
     except Exception as e:
@@ -12,10 +12,13 @@ Clean separation of concerns:
 Single source of truth via iter_input_paths()
 """
 import logging
+import os
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
 from pathlib import Path
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Tuple
 
-from PyA3EDA.core.utils.file_utils import read_text
+from PyA3EDA.core.utils.file_utils import read_text_cached
 from PyA3EDA.core.parsers.qchem_result_parser import (
     parse_energy, parse_final_energy, parse_total_energy, parse_enthalpy, parse_entropy, 
     parse_optimization_status, parse_thermodynamic_conditions, parse_qrrho_parameters, 
@@ -32,53 +35,46 @@ from PyA3EDA.core.builders.builder import iter_input_paths
 
 # CORE EXTRACTION FUNCTIONS (pure)
 
-def _extract_base_metadata(metadata: Dict[str, Any]) -> Dict[str, Any]:
-    """Extract base metadata fields common to all extraction types."""
-    return {
-        "Species": metadata.get("Species", "unknown"),
-        "Category": metadata.get("Category", "unknown"),
-        "Branch": metadata.get("Branch", "unknown"),
-        "Calc_Type": metadata.get("Calc_Type", "unknown"),
-        "Catalyst": metadata.get("Catalyst", ""),
-        "Mode": metadata.get("Mode", "unknown"),
-        "eda2": metadata.get("eda2", "unknown"),
-        # Component information for profile extraction
-        "reactants": metadata.get("reactants", []),
-        "products": metadata.get("products", []),
-        "catalysts": metadata.get("catalysts", []),
-        "all_reactants": metadata.get("all_reactants", []),
-        "all_products": metadata.get("all_products", []),
-        "all_catalysts": metadata.get("all_catalysts", [])
-    }
+# Row schemas: (column, default) pairs in CSV column order
+_BASE_METADATA_FIELDS = (
+    ("Species", "unknown"), ("Category", "unknown"), ("Branch", "unknown"),
+    ("Calc_Type", "unknown"), ("Catalyst", ""), ("Mode", "unknown"), ("eda2", "unknown"),
+)
+# Component information for profile extraction (lists, defaulting to a fresh empty list)
+_COMPONENT_FIELDS = (
+    "reactants", "products", "catalysts", "all_reactants", "all_products", "all_catalysts",
+)
+_OPT_METADATA_FIELDS = (
+    ("Method", "unknown"), ("Method_Combo", "unknown"), ("Basis", "unknown"),
+    ("Dispersion", "unknown"), ("Solvent", "unknown"),
+)
+_SP_METADATA_FIELDS = (
+    # Base method info for folder structure
+    ("Method_Combo", "unknown"),
+    # SP-specific method info
+    ("SP_Method", "unknown"), ("SP_Method_Combo", "unknown"), ("SP_Basis", "unknown"),
+    ("SP_Dispersion", "unknown"), ("SP_Solvent", "unknown"),
+)
+
+
+def _build_metadata_row(metadata: Dict[str, Any], extra_fields: Tuple[Tuple[str, Any], ...] = ()) -> Dict[str, Any]:
+    """Build a data row from metadata following the predeclared schema, in column order."""
+    row = {key: metadata.get(key, default) for key, default in _BASE_METADATA_FIELDS}
+    for key in _COMPONENT_FIELDS:
+        row[key] = metadata.get(key, [])
+    for key, default in extra_fields:
+        row[key] = metadata.get(key, default)
+    return row
 
 
 def _extract_opt_metadata(metadata: Dict[str, Any]) -> Dict[str, Any]:
     """Extract OPT-specific metadata fields."""
-    base_metadata = _extract_base_metadata(metadata)
-    base_metadata.update({
-        "Method": metadata.get("Method", "unknown"),
-        "Method_Combo": metadata.get("Method_Combo", "unknown"),
-        "Basis": metadata.get("Basis", "unknown"),
-        "Dispersion": metadata.get("Dispersion", "unknown"),
-        "Solvent": metadata.get("Solvent", "unknown")
-    })
-    return base_metadata
+    return _build_metadata_row(metadata, _OPT_METADATA_FIELDS)
 
 
 def _extract_sp_metadata(metadata: Dict[str, Any]) -> Dict[str, Any]:
     """Extract SP-specific metadata fields."""
-    base_metadata = _extract_base_metadata(metadata)
-    base_metadata.update({
-        # Base method info for folder structure
-        "Method_Combo": metadata.get("Method_Combo", "unknown"),
-        # SP-specific method info
-        "SP_Method": metadata.get("SP_Method", "unknown"),
-        "SP_Method_Combo": metadata.get("SP_Method_Combo", "unknown"),
-        "SP_Basis": metadata.get("SP_Basis", "unknown"),
-        "SP_Dispersion": metadata.get("SP_Dispersion", "unknown"),
-        "SP_Solvent": metadata.get("SP_Solvent", "unknown")
-    })
-    return base_metadata
+    return _build_metadata_row(metadata, _SP_METADATA_FIELDS)
 
 
 def extract_opt_data(file_path: Path, metadata: Dict[str, Any], criteria: str = "SUCCESSFUL") -> Optional[Dict[str, Any]]:
@@ -100,7 +96,7 @@ def extract_opt_data(file_path: Path, metadata: Dict[str, Any], criteria: str =
         return None
         
     # Read file content
-    content = read_text(file_path)
+    content = read_text_cached(file_path)
     if not content:
         logging.warning(f"Could not read content from: {file_path}")
         return None
@@ -134,7 +130,7 @@ def extract_sp_data(file_path: Path, metadata: Dict[str, Any], criteria: str = "
         return None
         
     # Read file content
-    content = read_text(file_path)
+    content = read_text_cached(file_path)
     if not content:
         logging.warning(f"Could not read content from: {file_path}")
         return None
@@ -167,7 +163,7 @@ def extract_xyz_data(file_path: Path, metadata: Dict[str, Any], criteria: str =
         return None
     
     # Read file content
-    content = read_text(file_path)
+    content = read_text_cached(file_path)
     if not content:
         logging.warning(f"Could not read content from: {file_path}")
         return None
@@ -388,7 +384,7 @@ def _extract_eda_sp(sp_content: str, calc_type: str, metadata: Dict[str, Any], o
     # Determine EDA type and extract base energy
     if calc_type == "pol_cat":
         base_energy_ha = parse_eda_polarized_energy(sp_content)
-    elif calc_type in ["frz_cat", "full_cat"]:
+    elif calc_type in {"frz_cat", "full_cat"}:
         base_energy_ha = parse_eda_convergence_energy(sp_content)
     else:
         logging.warning(f"Unknown EDA calc_type: {calc_type}")
@@ -467,6 +463,13 @@ def apply_thermodynamic_corrections(data: Dict[str, Any], opt_content: str) -> N
         data.update(zpe_data)
 
 
+# Per-mode (energy, solvent) keys used by calculate_enthalpy_and_gibbs; anything but "sp" uses the OPT keys
+_MODE_KEYS = {
+    "opt": ("E (kcal/mol)", "Solvent"),
+    "sp": ("SP_E (kcal/mol)", "SP_Solvent"),
+}
+
+
 def calculate_enthalpy_and_gibbs(data: Dict[str, Any], mode: str) -> None:
     """Calculate H and G with optional solvent correction.
     
@@ -474,7 +477,7 @@ def calculate_enthalpy_and_gibbs(data: Dict[str, Any], mode: str) -> None:
         data: Dictionary with energy and thermodynamic corrections.
         mode: "sp" or "opt" (determines which keys to use).
     """
-    base_energy_key = f"{'SP_' if mode == 'sp' else ''}E (kcal/mol)"
+    base_energy_key, solvent_key = _MODE_KEYS.get(mode, _MODE_KEYS["opt"])
     
     # Calculate H = E + H_corr
     if base_energy_key in data and "Total Enthalpy Corr. (kcal/mol)" in data:
@@ -496,7 +499,6 @@ def calculate_enthalpy_and_gibbs(data: Dict[str, Any], mode: str) -> None:
     logging.debug(f"{mode.upper()}: Calculated G(gas) = {g_gas:.6f} kcal/mol at T={data['Temperature (K)']} K")
     
     # Apply solvent correction if any solvent model is used (not gas phase)
-    solvent_key = f"{'SP_' if mode == 'sp' else ''}Solvent"
     solvent = data.get(solvent_key, "gas").lower()
     if solvent != "gas" and all(k in data for k in ["Temperature (K)", "Pressure (atm)"]):
         temperature = data["Temperature (K)"]
@@ -515,13 +517,103 @@ def calculate_enthalpy_and_gibbs(data: Dict[str, Any], mode: str) -> None:
         logging.debug(f"{mode.upper()}: Gas phase calculation - no standard state correction applied")
 
 
+# PER-FILE WORKERS (module level so they can run in a process pool)
+
+def _extract_opt_file(input_path: Path, metadata: Dict[str, Any],
+                      criteria: str) -> Tuple[Optional[Dict[str, Any]], Optional[Dict[str, Any]]]:
+    """
+    Extract OPT and XYZ data for a single OPT input file.
+    
+    Returns:
+        Tuple of (opt_result, xyz_result), each None if skipped or extraction fails
+    """
+    output_path = input_path.with_suffix(".out")
+    
+    # Check if file should be processed with enhanced OPT validation
+    should_process, reason = should_process_file(input_path, criteria, metadata)
+    if not should_process:
+        logging.debug(f"Skipping OPT file {reason}: {input_path}")
+        return None, None
+    
+    # Extract OPT data, then XYZ data separately
+    opt_result = extract_opt_data(output_path, metadata, criteria)
+    xyz_result = extract_xyz_data(output_path, metadata, criteria)
+    return opt_result, xyz_result
+
+
+def _extract_sp_file(input_path: Path, metadata: Dict[str, Any], criteria: str,
+                     opt_output_path: Optional[Path], cache_key: str) -> Optional[Dict[str, Any]]:
+    """
+    Extract SP data for a single SP input file, reading the matching OPT output
+    (if any) for thermodynamic corrections.
+    """
+    output_path = input_path.with_suffix(".out")
+    
+    # Check if file should be processed
+    should_process, reason = should_process_file(input_path, criteria, metadata)
+    if not should_process:
+        logging.debug(f"Skipping SP file {reason}: {input_path}")
+        return None
+    
+    # Get corresponding OPT content for corrections
+    opt_content = read_text_cached(opt_output_path) if opt_output_path else None
+    if not opt_content:
+        logging.warning(f"No matching OPT found for SP {cache_key}")
+    else:
+        logging.debug(f"Found matching OPT for SP {cache_key}")
+    
+    return extract_sp_data(output_path, metadata, criteria, opt_content)
+
+
+def _init_worker_logging(level: int, formatter: Optional[logging.Formatter]) -> None:
+    """
+    Pool initializer applying the parent's root logging setup in a worker. Workers started
+    with spawn/forkserver do not inherit the CLI's basicConfig, so their messages would
+    otherwise be dropped; forked workers already have the handlers and are left untouched.
+    """
+    root = logging.getLogger()
+    if not root.handlers:
+        handler = logging.StreamHandler()
+        if formatter is not None:
+            handler.setFormatter(formatter)
+        root.addHandler(handler)
+    root.setLevel(level)
+
+
+def _worker_logging_args() -> Tuple[int, Optional[logging.Formatter]]:
+    """Returns the parent's root level and formatter for _init_worker_logging."""
+    root = logging.getLogger()
+    formatter = next((h.formatter for h in root.handlers if h.formatter is not None), None)
+    return root.level, formatter
+
+
+def _chunksize(n_tasks: int, max_workers: int) -> int:
+    """Pick a map chunksize giving each worker a few batches."""
+    return max(1, n_tasks // (max_workers * 4))
+
+
+def _opt_cache_key(metadata: Dict[str, Any]) -> str:
+    """Return the Species|Branch|Calc_Type key matching SP files to their OPT output."""
+    return f"{metadata.get('Species', 'unknown')}|{metadata.get('Branch', 'unknown')}|{metadata.get('Calc_Type', 'unknown')}"
+
+
 # MAIN EXTRACTION FUNCTION
 
-def extract_all_data(config_manager, system_dir: Path, criteria: str = "SUCCESSFUL") -> Dict[str, Dict[str, List[Dict[str, Any]]]]:
+def extract_all_data(config_manager, system_dir: Path, criteria: str = "SUCCESSFUL",
+                     max_workers: Optional[int] = None) -> Dict[str, Dict[str, List[Dict[str, Any]]]]:
     """
     Extract data for all method combos and return extracted data.
     Pure extraction function - does not handle export.
     
+    Output files of all combos are read and parsed in a process pool, OPT files first and
+    then SP files; results keep the discovery order.
+    
+    Args:
+        config_manager: ConfigManager instance
+        system_dir: Base system directory
+        criteria: Status criteria for file processing
+        max_workers: Number of worker processes (defaults to the CPU count, capped at the number of files)
+    
     Returns:
         Dictionary mapping method combo names to their extracted data
     """
@@ -547,84 +639,66 @@ def extract_all_data(config_manager, system_dir: Path, criteria: str = "SUCCESSF
         
     logging.info(f"Found {len(combo_files)} method combos: {sorted(combo_files.keys())}")
     
-    # Process each method combo
-    for combo_name, input_files in combo_files.items():
-        logging.info(f"Processing method combo: {combo_name}")
-        
-        # Separate files by type
-        opt_files = [(path, meta) for path, meta in input_files if meta.get("Mode") == "opt"]
-        sp_files = [(path, meta) for path, meta in input_files if meta.get("Mode") == "sp"]
-        
-        # Data containers
-        opt_data = []
-        sp_data = []
-        xyz_data = []
-        opt_content_cache = {}
-        
+    # Separate files by type across all combos, so the pool works through every combo's
+    # OPT files in one batch and every SP file in a second one instead of once per combo
+    opt_files = [(combo_name, path, meta) for combo_name, input_files in combo_files.items()
+                 for path, meta in input_files if meta.get("Mode") == "opt"]
+    sp_files = [(combo_name, path, meta) for combo_name, input_files in combo_files.items()
+                for path, meta in input_files if meta.get("Mode") == "sp"]
+    
+    n_tasks = len(opt_files) + len(sp_files)
+    if not n_tasks:
+        logging.warning("No OPT or SP input files to extract")
+        return {}
+    # No more worker processes than files, so small systems do not pay for a full-size pool
+    max_workers = min(max_workers or os.cpu_count() or 1, n_tasks)
+    
+    # Data containers per combo, in discovery order
+    combo_results = {combo_name: {"opt_data": [], "sp_data": [], "xyz_data": []} for combo_name in combo_files}
+    # OPT output paths for SP corrections, per combo; workers read the content themselves
+    # instead of shipping whole output files between processes
+    opt_output_cache = {combo_name: {} for combo_name in combo_files}
+    
+    with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_worker_logging,
+                             initargs=_worker_logging_args()) as pool:
         # Extract OPT data first (needed for SP corrections)
-        for input_path, metadata in opt_files:
-            output_path = input_path.with_suffix(".out")
-            
-            # Check if file should be processed with enhanced OPT validation
-            should_process, reason = should_process_file(input_path, criteria, metadata)
-            if not should_process:
-                logging.debug(f"Skipping OPT file {reason}: {input_path}")
-                continue
-            
-            # Extract OPT data
-            opt_result = extract_opt_data(output_path, metadata, criteria)
+        logging.info(f"Extracting {len(opt_files)} OPT files")
+        opt_results = pool.map(
+            _extract_opt_file,
+            [path for _, path, _ in opt_files], [meta for _, _, meta in opt_files], repeat(criteria),
+            chunksize=_chunksize(len(opt_files), max_workers)
+        )
+        for (combo_name, input_path, metadata), (opt_result, xyz_result) in zip(opt_files, opt_results):
             if opt_result:
-                opt_data.append(opt_result)
+                combo_results[combo_name]["opt_data"].append(opt_result)
                 
-                # Cache OPT content for SP corrections with enhanced key
-                opt_content = read_text(output_path)
-                if opt_content:
-                    # Create comprehensive cache key: Species|Branch|Calc_Type
-                    cache_key = f"{metadata.get('Species', 'unknown')}|{metadata.get('Branch', 'unknown')}|{metadata.get('Calc_Type', 'unknown')}"
-                    opt_content_cache[cache_key] = opt_content
-                    logging.debug(f"Caching OPT with key: {cache_key}")
-                    
-            # Extract XYZ data separately
-            xyz_result = extract_xyz_data(output_path, metadata, criteria)
+                # Cache OPT output for SP corrections with enhanced key: Species|Branch|Calc_Type
+                cache_key = _opt_cache_key(metadata)
+                opt_output_cache[combo_name][cache_key] = input_path.with_suffix(".out")
+                logging.debug(f"Caching OPT with key: {cache_key}")
+            
             if xyz_result:
-                xyz_data.append(xyz_result)
+                combo_results[combo_name]["xyz_data"].append(xyz_result)
         
-        # Extract SP data with OPT corrections
-        for input_path, metadata in sp_files:
-            output_path = input_path.with_suffix(".out")
-            
-            # Check if file should be processed
-            should_process, reason = should_process_file(input_path, criteria, metadata)
-            if not should_process:
-                logging.debug(f"Skipping SP file {reason}: {input_path}")
-                continue
-            
-            # Get corresponding OPT content for corrections using enhanced key
-            # Create matching cache key: Species|Branch|Calc_Type
-            cache_key = f"{metadata.get('Species', 'unknown')}|{metadata.get('Branch', 'unknown')}|{metadata.get('Calc_Type', 'unknown')}"
-            opt_content = opt_content_cache.get(cache_key)
-            
-            logging.debug(f"SP file looking for OPT key: {cache_key}")
-            if not opt_content:
-                logging.warning(f"No matching OPT found for SP {cache_key}")
-                logging.debug(f"Available OPT keys in cache: {list(opt_content_cache.keys())}")
-            else:
-                logging.debug(f"Found matching OPT for SP {cache_key}")
-            
-            sp_result = extract_sp_data(output_path, metadata, criteria, opt_content)
+        # Extract SP data with OPT corrections, matched by Species|Branch|Calc_Type within the combo
+        logging.info(f"Extracting {len(sp_files)} SP files")
+        sp_keys = [_opt_cache_key(meta) for _, _, meta in sp_files]
+        sp_results = pool.map(
+            _extract_sp_file,
+            [path for _, path, _ in sp_files], [meta for _, _, meta in sp_files], repeat(criteria),
+            [opt_output_cache[combo_name].get(key) for (combo_name, _, _), key in zip(sp_files, sp_keys)], sp_keys,
+            chunksize=_chunksize(len(sp_files), max_workers)
+        )
+        for (combo_name, _, _), sp_result in zip(sp_files, sp_results):
             if sp_result:
-                sp_data.append(sp_result)
-
-        # Store results for this combo
-        combo_data = {
-            "opt_data": opt_data,
-            "sp_data": sp_data,
-            "xyz_data": xyz_data
-        }
-        
+                combo_results[combo_name]["sp_data"].append(sp_result)
+    
+    # Store results per combo
+    for combo_name, combo_data in combo_results.items():
         if any(combo_data.values()):
             all_extracted_data[combo_name] = combo_data
-            logging.info(f"Extracted from {combo_name}: {len(opt_data)} OPT, {len(sp_data)} SP, {len(xyz_data)} XYZ")
+            logging.info(f"Extracted from {combo_name}: {len(combo_data['opt_data'])} OPT, "
+                         f"{len(combo_data['sp_data'])} SP, {len(combo_data['xyz_data'])} XYZ")
     
     # Return extracted data for external export handling
     if all_extracted_data:
@@ -9,7 +9,36 @@ Example:
      all_profiles = process_all_profiles(extracted_data)
 """
 import logging
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
+
+
+# Stage type configurations for _generate_stages
+STAGE_CONFIGURATIONS = {
+    "reactants": {
+        "branch": "reactants", "category": "no_cat", "stage_name": "Reactants",
+        "needs_missing_components": True, "needs_catalyst": True, "components_key": "all_reactants"
+    },
+    "products": {
+        "branch": "products", "category": "no_cat", "stage_name": "Products", 
+        "needs_missing_components": True, "needs_catalyst": True, "components_key": "all_products"
+    },
+    "preTS": {
+        "branch": "preTS", "category": "cat", "stage_name": "preTS",
+        "needs_missing_components": True, "needs_calc_type": True, "components_key": "all_reactants"
+    },
+    "postTS": {
+        "branch": "postTS", "category": "cat", "stage_name": "postTS",
+        "needs_missing_components": True, "needs_calc_type": True, "components_key": "all_products"
+    },
+    "ts_cat": {
+        "branch": "ts", "category": "cat", "stage_name": "TS",
+        "needs_calc_type": True, "catalyst_present": True
+    },
+    "ts_nocat": {
+        "branch": "ts", "category": "no_cat", "stage_name": "TS",
+        "needs_catalyst": True
+    }
+}
 
 
 def _get_components(raw_data: List[Dict[str, Any]]) -> Dict[str, List[str]]:
@@ -67,18 +96,20 @@ def _get_energy(species: str, energy_lookup: Dict[str, Dict[str, float]], calc_t
     return energy_lookup.get(species)
 
 
-def _find_entries(raw_data: List[Dict[str, Any]], branch: str = None, category: str = None, catalyst: str = None) -> List[Dict[str, Any]]:
-    """Find calculation entries matching specified metadata criteria."""
-    matches = []
+def _build_entry_index(raw_data: List[Dict[str, Any]]) -> Dict[Tuple[str, ...], List[Dict[str, Any]]]:
+    """Index calculation entries by (Branch, Category) and by (Branch, Category, Catalyst), keeping data order."""
+    entry_index = {}
     for entry in raw_data:
-        if branch and entry.get("Branch") != branch:
-            continue
-        if category and entry.get("Category") != category:
-            continue
-        if catalyst and entry.get("Catalyst") != catalyst:
-            continue
-        matches.append(entry)
-    return matches
+        branch, category = entry.get("Branch"), entry.get("Category")
+        entry_index.setdefault((branch, category), []).append(entry)
+        entry_index.setdefault((branch, category, entry.get("Catalyst")), []).append(entry)
+    return entry_index
+
+
+def _find_entries(entry_index: Dict[Tuple[str, ...], List[Dict[str, Any]]], branch: str, category: str, catalyst: str = None) -> List[Dict[str, Any]]:
+    """Find calculation entries matching specified metadata criteria (any catalyst if none given)."""
+    key = (branch, category, catalyst) if catalyst else (branch, category)
+    return entry_index.get(key, [])
 
 
 def _create_stage(stage_name: str, species_list: List[str], energy_lookup: Dict[str, Dict[str, float]], calc_types: List[str] = None) -> Optional[Dict[str, Any]]:
@@ -140,44 +171,16 @@ def _create_stage(stage_name: str, species_list: List[str], energy_lookup: Dict[
     }
 
 
-def _generate_stages(stage_type: str, catalyst: str, raw_data: List[Dict[str, Any]], components: Dict[str, List[str]], energy_lookup: Dict[str, Dict[str, float]]) -> List[Dict[str, Any]]:
+def _generate_stages(stage_type: str, catalyst: str, entry_index: Dict[Tuple[str, ...], List[Dict[str, Any]]], components: Dict[str, List[str]], energy_lookup: Dict[str, Dict[str, float]]) -> List[Dict[str, Any]]:
     """Universal stage generator for all stage types using configuration-driven approach."""
     
-    # Stage type configurations
-    stage_configurations = {
-        "reactants": {
-            "branch": "reactants", "category": "no_cat", "stage_name": "Reactants",
-            "needs_missing_components": True, "needs_catalyst": True, "components_key": "all_reactants"
-        },
-        "products": {
-            "branch": "products", "category": "no_cat", "stage_name": "Products", 
-            "needs_missing_components": True, "needs_catalyst": True, "components_key": "all_products"
-        },
-        "preTS": {
-            "branch": "preTS", "category": "cat", "stage_name": "preTS",
-            "needs_missing_components": True, "needs_calc_type": True, "components_key": "all_reactants"
-        },
-        "postTS": {
-            "branch": "postTS", "category": "cat", "stage_name": "postTS",
-            "needs_missing_components": True, "needs_calc_type": True, "components_key": "all_products"
-        },
-        "ts_cat": {
-            "branch": "ts", "category": "cat", "stage_name": "TS",
-            "needs_calc_type": True, "catalyst_present": True
-        },
-        "ts_nocat": {
-            "branch": "ts", "category": "no_cat", "stage_name": "TS",
-            "needs_catalyst": True
-        }
-    }
-    
-    stage_config = stage_configurations.get(stage_type)
+    stage_config = STAGE_CONFIGURATIONS.get(stage_type)
     if not stage_config:
         return []
         
     # Find entries based on configuration
     entries = _find_entries(
-        raw_data,
+        entry_index,
         branch=stage_config["branch"], 
         category=stage_config["category"],
         catalyst=catalyst if stage_config["category"] == "cat" else None
@@ -202,7 +205,7 @@ def _generate_stages(stage_type: str, catalyst: str, raw_data: List[Dict[str, An
         # Add missing components if needed
         if stage_config.get("needs_missing_components") and stage_config.get("components_key"):
             components_list = components[stage_config["components_key"]]
-            present_components = entry.get(stage_config["components_key"].replace("all_", ""), [])
+            present_components = set(entry.get(stage_config["components_key"].replace("all_", ""), []))
             missing_components = [c for c in components_list if c not in present_components]
             
             if missing_components:
@@ -229,17 +232,17 @@ def _generate_stages(stage_type: str, catalyst: str, raw_data: List[Dict[str, An
     return stages
 
 
-def _generate_catalyst_profile(catalyst: str, raw_data: List[Dict[str, Any]], components: Dict[str, List[str]], energy_lookup: Dict[str, Dict[str, float]]) -> List[Dict[str, Any]]:
+def _generate_catalyst_profile(catalyst: str, entry_index: Dict[Tuple[str, ...], List[Dict[str, Any]]], components: Dict[str, List[str]], energy_lookup: Dict[str, Dict[str, float]]) -> List[Dict[str, Any]]:
     """Generate a complete profile for a single catalyst using unified stage generation."""
     profile = []
     
     # Add stages in order: reactants -> preTS -> TS -> postTS -> products
-    profile.extend(_generate_stages("reactants", catalyst, raw_data, components, energy_lookup))
-    profile.extend(_generate_stages("preTS", catalyst, raw_data, components, energy_lookup))
-    profile.extend(_generate_stages("ts_cat", catalyst, raw_data, components, energy_lookup))
-    profile.extend(_generate_stages("ts_nocat", catalyst, raw_data, components, energy_lookup))
-    profile.extend(_generate_stages("postTS", catalyst, raw_data, components, energy_lookup))
-    profile.extend(_generate_stages("products", catalyst, raw_data, components, energy_lookup))
+    profile.extend(_generate_stages("reactants", catalyst, entry_index, components, energy_lookup))
+    profile.extend(_generate_stages("preTS", catalyst, entry_index, components, energy_lookup))
+    profile.extend(_generate_stages("ts_cat", catalyst, entry_index, components, energy_lookup))
+    profile.extend(_generate_stages("ts_nocat", catalyst, entry_index, components, energy_lookup))
+    profile.extend(_generate_stages("postTS", catalyst, entry_index, components, energy_lookup))
+    profile.extend(_generate_stages("products", catalyst, entry_index, components, energy_lookup))
     
     return profile
 
@@ -258,19 +261,25 @@ def _filter_profile(profile: List[Dict[str, Any]], energy_type: str) -> List[Dic
         return []
     
     stage_groups = {}
+    # Original position of every stage, used to restore the profile order at the end
+    positions = {}
     
     # Group by stage name (e.g., "Reactants", "preTS", "TS", etc.)
-    for stage in profile:
-        stage_name = stage.get("Stage", "")
-        if stage_name not in stage_groups:
-            stage_groups[stage_name] = []
-        stage_groups[stage_name].append(stage)
+    for index, stage in enumerate(profile):
+        positions[id(stage)] = index
+        stage_groups.setdefault(stage.get("Stage", ""), []).append(stage)
     
     filtered = []
     for stage_name, stages in stage_groups.items():
-        # Subgroup stages: those with calc_types vs those without
-        calc_type_stages = [s for s in stages if s.get("Calc_Type") and s.get("Calc_Type") not in [None, "", "unknown"]]
-        no_calc_type_stages = [s for s in stages if not s.get("Calc_Type") or s.get("Calc_Type") in [None, "", "unknown"]]
+        # Subgroup stages in one pass: those with calc_types vs those without
+        calc_type_stages = []
+        no_calc_type_stages = []
+        for s in stages:
+            calc_type = s.get("Calc_Type")
+            if calc_type and calc_type != "unknown":
+                calc_type_stages.append(s)
+            else:
+                no_calc_type_stages.append(s)
         
         # Handle calc_type subgroup: smart filtering via full_cat
         if calc_type_stages:
@@ -303,7 +312,7 @@ def _filter_profile(profile: List[Dict[str, Any]], energy_type: str) -> List[Dic
             min_no_calc = min(no_calc_type_stages, key=lambda x: x.get(energy_key, float('inf')))
             filtered.append(min_no_calc)
     
-    return sorted(filtered, key=lambda s: profile.index(s))  # Keep original order
+    return sorted(filtered, key=lambda s: positions[id(s)])  # Keep original order
 
 
 def extract_profiles(raw_data_list: List[Dict[str, Any]], filter_duplicates: bool = False) -> Dict[str, Dict[str, List[Dict[str, Any]]]]:
@@ -323,10 +332,11 @@ def extract_profiles(raw_data_list: List[Dict[str, Any]], filter_duplicates: boo
     # Build lookup structures
     components = _get_components(raw_data_list)
     energy_lookup = _build_energy_lookup(raw_data_list)
+    entry_index = _build_entry_index(raw_data_list)
     
     profiles = {}
     for catalyst in components["all_catalysts"]:
-        raw_profile = _generate_catalyst_profile(catalyst, raw_data_list, components, energy_lookup)
+        raw_profile = _generate_catalyst_profile(catalyst, entry_index, components, energy_lookup)
         if raw_profile:  # Only include non-empty profiles
             catalyst_profiles = {"raw": raw_profile}
             
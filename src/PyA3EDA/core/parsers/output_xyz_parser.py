@@ -2,6 +2,16 @@ import re
 from typing import Optional, Dict, Any
 from PyA3EDA.core.utils.xyz_format_utils import format_xyz_coordinate_line
 
+ORIENTATION_TAG = "Standard Nuclear Orientation"
+
+# Coordinate line: index, element symbol and three numbers. Leading whitespace is limited
+# to spaces/tabs so that a match never spans a line break.
+COORD_LINE_RE = re.compile(
+    r"^[^\S\n]*\d+[^\S\n]+([A-Za-z]+)[^\S\n]+([-+]?\d+(?:\.\d+)?(?:[eE][-+]?\d+)?)[ \t]+"
+    r"([-+]?\d+(?:\.\d+)?(?:[eE][-+]?\d+)?)[ \t]+([-+]?\d+(?:\.\d+)?(?:[eE][-+]?\d+)?)",
+    re.MULTILINE
+)
+
 def parse_qchem_output_xyz(out_text: str, identifier: str) -> Optional[Dict[str, Any]]:
     """
     Parses a Q-Chem output file text to extract the final atomic coordinates from the output.
@@ -21,29 +31,18 @@ def parse_qchem_output_xyz(out_text: str, identifier: str) -> Optional[Dict[str,
     # Extract charge and multiplicity from the molecular input section
     charge, multiplicity = _extract_charge_multiplicity(out_text)
     
-    # Locate the last occurrence of the orientation block.
-    orient_tag = "Standard Nuclear Orientation"
-    orient_positions = [m.start() for m in re.finditer(re.escape(orient_tag), out_text)]
-    if not orient_positions:
+    # Locate the last occurrence of the orientation block by searching backwards from the end.
+    last_orient_index = out_text.rfind(ORIENTATION_TAG)
+    if last_orient_index == -1:
         return None
-    last_orient_index = orient_positions[-1]
-    orientation_block = out_text[last_orient_index:]
     
-    # Use a robust regex to match coordinate lines in the orientation block.
-    coord_line_re = re.compile(
-        r"^\s*\d+\s+([A-Za-z]+)\s+([-+]?\d+(?:\.\d+)?(?:[eE][-+]?\d+)?)[ \t]+"
-        r"([-+]?\d+(?:\.\d+)?(?:[eE][-+]?\d+)?)[ \t]+([-+]?\d+(?:\.\d+)?(?:[eE][-+]?\d+)?)",
-        re.MULTILINE
-    )
-    atoms = []
-    for line in orientation_block.splitlines():
-        match = coord_line_re.match(line)
-        if match:
-            element = match.group(1)
-            x = float(match.group(2))
-            y = float(match.group(3))
-            z = float(match.group(4))
-            atoms.append(format_xyz_coordinate_line(element, x, y, z))
+    # Match coordinate lines directly in the text following the last orientation tag,
+    # without copying the remainder or splitting it into lines.
+    atoms = [
+        format_xyz_coordinate_line(
+            match.group(1), float(match.group(2)), float(match.group(3)), float(match.group(4)))
+        for match in COORD_LINE_RE.finditer(out_text, last_orient_index)
+    ]
     
     if not atoms:
         return None
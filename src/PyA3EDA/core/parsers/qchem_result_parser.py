@@ -107,33 +107,27 @@ def extract_with_pattern(content: str, primary_pattern: Pattern, fallback_patter
     return float(last_match), fallback_used
 
 
+def _energy_entry(prefix: str, value: float, unit: str) -> Dict[str, Any]:
+    """Return an energy value keyed by its parsed unit together with its kcal/mol conversion."""
+    return {
+        f"{prefix} ({unit})": value,
+        f"{prefix} (kcal/mol)": convert_unit(value, unit, "kcal/mol")
+    }
+
+
 # PURE PARSING FUNCTIONS - Each function parses one specific data type
 
 
 def parse_final_energy(content: str, prefix: str = "E") -> Optional[Dict[str, Any]]:
     """Parse final energy from OPT calculations (Final energy is pattern)."""
     result, _ = extract_with_pattern(content, PATTERNS["final_energy"], default_unit="Ha")
-    
-    if result is not None:
-        energy_value, energy_unit = result
-        return {
-            f"{prefix} ({energy_unit})": energy_value,
-            f"{prefix} (kcal/mol)": convert_unit(energy_value, energy_unit, "kcal/mol")
-        }
-    return None
+    return _energy_entry(prefix, *result) if result is not None else None
 
 
 def parse_total_energy(content: str, prefix: str = "E") -> Optional[Dict[str, Any]]:
     """Parse total energy from SP calculations (Total energy = pattern)."""
     result, _ = extract_with_pattern(content, PATTERNS["total_energy"], default_unit="Ha")
-    
-    if result is not None:
-        energy_value, energy_unit = result
-        return {
-            f"{prefix} ({energy_unit})": energy_value,
-            f"{prefix} (kcal/mol)": convert_unit(energy_value, energy_unit, "kcal/mol")
-        }
-    return None
+    return _energy_entry(prefix, *result) if result is not None else None
 
 
 def parse_energy(content: str, prefix: str = "E") -> Optional[Dict[str, Any]]:
@@ -142,12 +136,9 @@ def parse_energy(content: str, prefix: str = "E") -> Optional[Dict[str, Any]]:
         content, PATTERNS["final_energy"], PATTERNS["total_energy"], default_unit="Ha")
     
     if result is not None:
-        energy_value, energy_unit = result
-        return {
-            f"{prefix} ({energy_unit})": energy_value,
-            f"{prefix} (kcal/mol)": convert_unit(energy_value, energy_unit, "kcal/mol"),
-            "energy_fallback_used": fallback_used
-        }
+        data = _energy_entry(prefix, *result)
+        data["energy_fallback_used"] = fallback_used
+        return data
     return None
 
 
@@ -271,10 +262,7 @@ def parse_eda_polarized_energy(content: str, prefix: str = "SP_E") -> Optional[D
     if result is not None:
         # Assume it's a single float value in Hartree
         energy_value = result if isinstance(result, (int, float)) else result[0]
-        return {
-            f"{prefix} (Ha)": energy_value,
-            f"{prefix} (kcal/mol)": convert_unit(energy_value, "Ha", "kcal/mol")
-        }
+        return _energy_entry(prefix, energy_value, "Ha")
     return None
 
 
@@ -285,10 +273,7 @@ def parse_eda_convergence_energy(content: str, prefix: str = "SP_E") -> Optional
     if result is not None:
         # Assume it's a single float value in Hartree
         energy_value = result if isinstance(result, (int, float)) else result[0]
-        return {
-            f"{prefix} (Ha)": energy_value,
-            f"{prefix} (kcal/mol)": convert_unit(energy_value, "Ha", "kcal/mol")
-        }
+        return _energy_entry(prefix, energy_value, "Ha")
     return None
 
 
@@ -299,8 +284,5 @@ def parse_bsse_energy(content: str) -> Optional[Dict[str, Any]]:
     if result is not None:
         # Assume it's a single float value in kJ/mol
         energy_value = result if isinstance(result, (int, float)) else result[0]
-        return {
-            "bsse_energy (kJ/mol)": energy_value,
-            "bsse_energy (kcal/mol)": convert_unit(energy_value, "kJ/mol", "kcal/mol")
-        }
+        return _energy_entry("bsse_energy", energy_value, "kJ/mol")
     return None
\ No newline at end of file
@@ -7,6 +7,15 @@ Parses the contents of Q-Chem status and error files to determine the calculatio
 import re
 from typing import Tuple
 
+# Status-check patterns, compiled once at import
+CRASH_ERROR_PATTERN = re.compile(r'error occurred.*?\n\s*(.*?)(?:\n{2,}|\Z)', re.DOTALL)
+FATAL_ERROR_PATTERN = re.compile(r'Q-Chem fatal error occurred.*?\n\s*(.*?)(?:\n\n|\Z)', re.DOTALL)
+JOB_TIME_PATTERN = re.compile(r'Total job time:\s*(.*)')
+WALL_TIME_PATTERN = re.compile(r'(\d+(?:\.\d+)?)s\(wall\)')
+# Cut an error message at its first sentence or clause (only the first split is needed)
+CRASH_MESSAGE_SPLIT = re.compile(r'[.;]|\band\b')
+FATAL_MESSAGE_SPLIT = re.compile(r'[.;]')
+
 def parse_qchem_status(content: str, err_content: str, submission_exists: bool = False) -> Tuple[str, str]:
     """
     Parses Q-Chem status and error text and returns a tuple (status, details).
@@ -26,11 +35,10 @@ def parse_qchem_status(content: str, err_content: str, submission_exists: bool =
         error_msg = 'Q-Chem execution crashed'
         if content:
             if 'error occurred' in content:
-                error_pattern = r'error occurred.*?\n\s*(.*?)(?:\n{2,}|\Z)'
-                error_match = re.search(error_pattern, content, re.DOTALL)
+                error_match = CRASH_ERROR_PATTERN.search(content)
                 if error_match:
                     full_msg = error_match.group(1).strip()
-                    error_msg = re.split(r'[.;]|\band\b', full_msg)[0].strip()
+                    error_msg = CRASH_MESSAGE_SPLIT.split(full_msg, maxsplit=1)[0].strip()
                 else:
                     error_msg = 'Unknown fatal error'
             elif 'SGeom Failed' in content:
@@ -55,13 +63,12 @@ def parse_qchem_status(content: str, err_content: str, submission_exists: bool =
         return 'running', 'Calculation in progress'
 
     if 'Thank you very much' in content:
-        time_pattern = r'Total job time:\s*(.*)'
-        time_match = re.search(time_pattern, content)
+        time_match = JOB_TIME_PATTERN.search(content)
         
         if time_match:
             time_str = time_match.group(1).strip()
             # Extract wall time in seconds
-            wall_time_match = re.search(r'(\d+(?:\.\d+)?)s\(wall\)', time_str)
+            wall_time_match = WALL_TIME_PATTERN.search(time_str)
             
             if wall_time_match:
                 wall_seconds = float(wall_time_match.group(1))
@@ -77,11 +84,10 @@ def parse_qchem_status(content: str, err_content: str, submission_exists: bool =
         return 'SUCCESSFUL', f'Completed in {job_time}'
     
     if 'Q-Chem fatal error occurred' in content:
-        error_pattern = r'Q-Chem fatal error occurred.*?\n\s*(.*?)(?:\n\n|\Z)'
-        error_match = re.search(error_pattern, content, re.DOTALL)
+        error_match = FATAL_ERROR_PATTERN.search(content)
         if error_match:
             full_msg = error_match.group(1).strip()
-            error_msg = re.split(r'[.;]', full_msg)[0].strip()
+            error_msg = FATAL_MESSAGE_SPLIT.split(full_msg, maxsplit=1)[0].strip()
         else:
             error_msg = 'Unknown fatal error'
         return 'CRASH', error_msg
@@ -93,7 +99,9 @@ def parse_qchem_status(content: str, err_content: str, submission_exists: bool =
     if 'Insufficient memory' in content:
         return 'CRASH', 'Out of memory'
     
-    if 'killed' in content.lower() or 'terminating' in content.lower():
+    # Case-insensitive markers: lower the content once for both checks
+    lowered = content.lower()
+    if 'killed' in lowered or 'terminating' in lowered:
         return 'terminated', 'Job terminated unexpectedly'
     
     if content.strip():
@@ -16,6 +16,10 @@ matplotlib.use('PDF')  # Non-interactive backend
 import matplotlib.pyplot as plt
 
 
+# Calc_Type values that mean "no calculation type"
+_UNSET_CALC_TYPES = frozenset({None, "", "unknown"})
+
+
 def _convert_to_energy_dict(profile_data: List[Dict[str, Any]], energy_type: str) -> Dict[str, float]:
     """
     Convert profile data list to energy dictionary format expected by plotting functions.
@@ -39,7 +43,7 @@ def _convert_to_energy_dict(profile_data: List[Dict[str, Any]], energy_type: str
             continue
             
         # Build key based on stage and calc_type
-        if calc_type and calc_type not in [None, "", "unknown"]:
+        if calc_type and calc_type not in _UNSET_CALC_TYPES:
             key = f"{stage_name}_{calc_type}"
         else:
             key = stage_name
@@ -5,12 +5,30 @@ Handles the execution of Q-Chem calculations via subprocess.
 """
 import logging
 import subprocess
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+# Minimum spacing between qqchem submissions, to avoid overwhelming the scheduler
+SUBMIT_INTERVAL = 5.2
+_submit_lock = threading.Lock()
+_next_submit_at = 0.0
+
+def _wait_for_submit_slot() -> None:
+    """Reserve the next submission slot and sleep until it is due; safe to call from several threads."""
+    global _next_submit_at
+    with _submit_lock:
+        now = time.monotonic()
+        delay = _next_submit_at - now
+        _next_submit_at = max(now, _next_submit_at) + SUBMIT_INTERVAL
+    if delay > 0:
+        time.sleep(delay)
+
 def execute_qchem(input_file: Path, cores: int = 64, time_limit: str = "10-00:00:00", 
                  node: str = "c-06-10,c-06-11,c-06-12") -> bool:
     """Execute a Q-Chem calculation using qqchem submission script."""
+    _wait_for_submit_slot()
     logging.info(f'Executing qqchem for {input_file}')
     try:
         subprocess.run(
@@ -23,20 +41,24 @@ def execute_qchem(input_file: Path, cores: int = 64, time_limit: str = "10-00:00
             cwd=input_file.parent
         )
         logging.info(f'Submission successful for {input_file}')
-        time.sleep(5.2)  # Small delay to avoid overwhelming the scheduler
         return True
     except Exception as e:
         logging.error(f'Error executing qqchem for {input_file}: {e}')
         return False
 
-def run_all_calculations(config_manager, system_dir, run_criteria=None):
+def run_all_calculations(config_manager, system_dir, run_criteria=None, max_workers: int = 32):
     """
     Run calculations based on the specified run criteria.
     
+    Status checks are filesystem-bound and run concurrently in a thread pool.
+    Jobs are then submitted from the same pool; submissions start at least
+    SUBMIT_INTERVAL seconds apart, but a slow qqchem call no longer holds up the next one.
+    
     Args:
         config_manager: ConfigManager instance or raw config dict
         system_dir: Base system directory
         run_criteria: Criteria for which files to run
+        max_workers: Number of threads used for the status checks and submissions
     """
     from PyA3EDA.core.builders.builder import iter_input_paths
     from PyA3EDA.core.status.status_checker import should_process_file
@@ -47,17 +69,18 @@ def run_all_calculations(config_manager, system_dir, run_criteria=None):
     
     logging.info(f"Running calculations with criteria: {run_criteria}")
     
+    def check_input(input_path: Path):
+        """Return the path together with its (should_run, reason) decision."""
+        return input_path, *should_process_file(input_path, run_criteria)
+    
     # Get all input paths and process them based on criteria
-    count = 0
-    for input_path in iter_input_paths(config_manager, system_dir):
-        if not input_path.exists():
-            continue
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        to_submit = []
+        for input_path, should_run, reason in pool.map(check_input, iter_input_paths(config_manager, system_dir)):
+            if should_run:
+                logging.info(f"Submitting job ({reason}): {input_path.relative_to(system_dir)}")
+                to_submit.append(input_path)
         
-        should_run, reason = should_process_file(input_path, run_criteria)
-            
-        if should_run:
-            logging.info(f"Submitting job ({reason}): {input_path.relative_to(system_dir)}")
-            if execute_qchem(input_path):
-                count += 1
+        count = sum(pool.map(execute_qchem, to_submit))
     
     logging.info(f"Total jobs submitted: {count}")
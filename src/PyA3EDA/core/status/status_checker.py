@@ -6,11 +6,15 @@ grouping results by method_basis (first folder of the relative path),
 and printing formatted reports with intermediate group summaries and an overall summary.
 """
 
+import fnmatch
 import logging
+import os
+from concurrent.futures import Executor, ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Tuple, Iterator, Dict, List
+from typing import Callable, Tuple, Iterable, Iterator, Dict, FrozenSet, List, Optional
 from PyA3EDA.core.constants import Constants
-from PyA3EDA.core.utils.file_utils import read_text
+from PyA3EDA.core.utils.file_utils import TAIL_BYTES, read_text, read_text_tail
 from PyA3EDA.core.parsers.qchem_status_parser import parse_qchem_status
 from PyA3EDA.core.parsers.qchem_result_parser import parse_optimization_status, parse_imaginary_frequencies
 from PyA3EDA.core.builders.builder import iter_input_paths
@@ -23,8 +27,78 @@ if not summary_logger.handlers:
     summary_logger.addHandler(handler)
     summary_logger.propagate = False
 
+# Dispersion keywords mapped to their short labels for group names
+DISPERSION_LABELS = {
+    'empirical_grimme': 'D2', 'empirical_chg': 'CHG', 'empirical_grimme3': 'D3(0)',
+    'd3_zero': 'D3(0)', 'd3_bj': 'D3(BJ)', 'd3_cso': 'D3(CSO)', 'd3_zerom': 'D3M(0)', 
+    'd3_bjm': 'D3M(BJ)', 'd3_op': 'D3(op)', 'd3': 'D3', 'd4': 'D4'
+}
+# Values meaning "no dispersion" / "no solvent" in group names
+_UNSET_DISPERSION = frozenset({"false", "none", ""})
+_UNSET_SOLVENT = frozenset({"none", ""})
+# Reverse of Constants.ESCAPE_MAP, for turning sanitized names back into their originals
+_UNESCAPE_MAP = {s: o for o, s in Constants.ESCAPE_MAP.items()}
 
-def get_status_for_file(input_file: Path, metadata: dict = None) -> Tuple[str, str]:
+
+@lru_cache(maxsize=1024)
+def _unsanitize(name: str) -> str:
+    """Undoes sanitize_filename escaping; memoized since each method/basis name repeats across many files."""
+    for s, o in _UNESCAPE_MAP.items():
+        name = name.replace(s, o)
+    return name
+
+
+def scan_directory_tree(root_dir: Path) -> Dict[str, FrozenSet[str]]:
+    """
+    Walks root_dir once with os.scandir and maps every directory path (as str)
+    to the names of the files it contains.
+    DirEntry.is_dir() reuses the type information returned by the directory read,
+    so the whole tree is listed without a stat call per file.
+    Symlinked directories are not descended into (a link back to an ancestor would
+    otherwise loop); inputs below them are not in the listing and get probed directly.
+    """
+    listing: Dict[str, FrozenSet[str]] = {}
+    pending = [os.fspath(root_dir)]
+    while pending:
+        current = pending.pop()
+        names = set()
+        try:
+            with os.scandir(current) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        pending.append(entry.path)
+                    else:
+                        names.add(entry.name)
+        except OSError as e:
+            logging.debug(f"Could not scan directory {current}: {e}")
+            continue
+        listing[current] = frozenset(names)
+    return listing
+
+
+def _file_signature(file_path: str) -> Optional[Tuple[int, int]]:
+    """Returns (mtime_ns, size) for an existing file, or None if it cannot be stat'ed."""
+    try:
+        stat = os.stat(file_path)
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+def _has_submission_file(names: Iterable[str], input_stem: str) -> bool:
+    """Returns True as soon as one of names is a queue submission file for input_stem."""
+    # Pattern 1: filename.in_jobid.taskid 
+    submission_pattern1 = f"{input_stem}.in_[0-9]*.[0-9]*"
+    # Pattern 2: .filename.in.jobid.qcin.taskid
+    submission_pattern2 = f".{input_stem}.in.[0-9]*.qcin.[0-9]*"
+    return any(
+        fnmatch.fnmatch(name, submission_pattern1) or fnmatch.fnmatch(name, submission_pattern2)
+        for name in names
+    )
+
+
+def get_status_for_file(input_file: Path, metadata: dict = None,
+                        dir_listing: Optional[Dict[str, FrozenSet[str]]] = None) -> Tuple[str, str]:
     """
     Reads the output and error files corresponding to the input_file and determines the status.
     If metadata is provided for successful OPT calculations, adds validation and convergence info.
@@ -32,32 +106,67 @@ def get_status_for_file(input_file: Path, metadata: dict = None) -> Tuple[str, s
     Args:
         input_file: Path to the input file
         metadata: Optional metadata for enhanced OPT validation
+        dir_listing: Optional directory listing from scan_directory_tree; when it covers the
+            input's folder, file existence and submission files are looked up there
+            instead of probing the filesystem
         
     Returns:
         Tuple[str, str]: (status, details) with optional OPT validation info
     """
-    output_file = input_file.with_suffix('.out')
-    error_file = input_file.with_suffix('.err')
-    content = read_text(output_file) if output_file.exists() else ""
-    err_content = read_text(error_file) if error_file.exists() else ""
-    
-    # Check if job is still running based on submission file
-    input_stem = input_file.stem
-    # Pattern 1: filename.in_jobid.taskid 
-    submission_pattern1 = f"{input_stem}.in_[0-9]*.[0-9]*"
-    # Pattern 2: .filename.in.jobid.qcin.taskid
-    submission_pattern2 = f".{input_stem}.in.[0-9]*.qcin.[0-9]*"
+    # Derive sibling file names from a single string conversion of the input path
+    input_root = os.path.splitext(os.fspath(input_file))[0]
+    input_dir, input_stem = os.path.split(input_root)
+    output_file = input_root + '.out'
+    error_file = input_root + '.err'
+    dir_names = dir_listing.get(input_dir) if dir_listing is not None else None
+
+    # File signatures double as existence checks and as the status cache key
+    if dir_names is not None:
+        output_sig = _file_signature(output_file) if input_stem + '.out' in dir_names else None
+        error_sig = _file_signature(error_file) if input_stem + '.err' in dir_names else None
+        submission_exists = _has_submission_file(dir_names, input_stem)
+    else:
+        output_sig = _file_signature(output_file)
+        error_sig = _file_signature(error_file)
+        # Check if job is still running based on submission file
+        try:
+            with os.scandir(input_dir or os.curdir) as entries:
+                submission_exists = _has_submission_file((entry.name for entry in entries), input_stem)
+        except OSError:
+            submission_exists = False
+
+    mode = metadata.get("Mode") if metadata else None
+    branch = metadata.get("Branch", "") if metadata else ""
+    return _evaluate_status(output_file, error_file, output_sig, error_sig, submission_exists, mode, branch)
+
+
+@lru_cache(maxsize=4096)
+def _evaluate_status(output_file: str, error_file: str,
+                     output_sig: Optional[Tuple[int, int]], error_sig: Optional[Tuple[int, int]],
+                     submission_exists: bool, mode: Optional[str], branch: str) -> Tuple[str, str]:
+    """
+    Determines the status from the output and error files. Memoized on the file signatures,
+    so repeated checks of an unchanged calculation (status report, input generation,
+    extraction) do not re-read and re-parse its files.
+    """
+    err_content = read_text(error_file) if error_sig is not None else ""
     
-    submission_exists = (
-        bool(list(input_file.parent.glob(submission_pattern1))) or
-        bool(list(input_file.parent.glob(submission_pattern2)))
-    )
+    content = ""
+    if output_sig is not None:
+        # Completion markers sit at the end of the output. Unless OPT validation needs the whole
+        # file, settle successful large outputs from their tail without reading all of them
+        if mode != "opt" and output_sig[1] > TAIL_BYTES:
+            status, details = parse_qchem_status(read_text_tail(output_file), err_content, submission_exists)
+            if status == "SUCCESSFUL":
+                return status, details
+        # Read uncached: a status run reads each output once, and this result is memoized anyway
+        content = read_text(output_file)
     
     # Get base status first
     status, details = parse_qchem_status(content, err_content, submission_exists)
     
     # Enhanced validation for successful OPT calculations only
-    if (status.lower() == "successful" and metadata and metadata.get("Mode") == "opt" and content):
+    if (status.lower() == "successful" and mode == "opt" and content):
         # Check optimization status and imaginary frequencies
         opt_status = parse_optimization_status(content)
         imag_freq_parsed = parse_imaginary_frequencies(content)
@@ -78,8 +187,7 @@ def get_status_for_file(input_file: Path, metadata: dict = None) -> Tuple[str, s
         imag_freq = int(imag_freq_parsed.get("Imaginary Frequencies", 0))
         
         # Simple validation logic
-        branch = metadata.get("Branch", "").lower()
-        ts_expected = branch == "ts"
+        ts_expected = branch.lower() == "ts"
         
         # Check if validation fails
         validation_failed = False
@@ -114,25 +222,26 @@ def should_process_file(input_file: Path, criteria: str, metadata: dict = None)
     Returns:
         Tuple[bool, str]: (should_process, reason)
     """
-    if not input_file.exists():
+    input_str = os.fspath(input_file)
+    if not os.path.exists(input_str):
         return False, "File doesn't exist"
         
     if criteria is None:
         return False, "No criteria specified"
-        
-    if criteria.lower() == "all":
+    
+    criteria_lower = criteria.lower()
+    if criteria_lower == "all":
         return True, "Process all"
         
-    if criteria.lower() == "nofile":
-        output_file = input_file.with_suffix('.out')
-        if not output_file.exists():
+    if criteria_lower == "nofile":
+        if not os.path.exists(os.path.splitext(input_str)[0] + '.out'):
             return True, "Output file doesn't exist"
         return False, "Output file exists"
     
     # Use enhanced status checking if metadata is available
     status, details = get_status_for_file(input_file, metadata)
     
-    if status.lower() == criteria.lower():
+    if status.lower() == criteria_lower:
         return True, f"Status match: {status}"
     
     return False, f"Status mismatch: {status} ≠ {criteria}"
@@ -142,42 +251,25 @@ def group_paths_by_method_basis(path_items: List) -> Dict[str, List]:
     Groups paths by method combination with proper dispersion formatting.
     Uses metadata when available for accurate grouping, falls back to path-based grouping.
     """
-    # Dispersion formatting map
-    disp_map = {
-        'empirical_grimme': 'D2', 'empirical_chg': 'CHG', 'empirical_grimme3': 'D3(0)',
-        'd3_zero': 'D3(0)', 'd3_bj': 'D3(BJ)', 'd3_cso': 'D3(CSO)', 'd3_zerom': 'D3M(0)', 
-        'd3_bjm': 'D3M(BJ)', 'd3_op': 'D3(op)', 'd3': 'D3', 'd4': 'D4'
-    }
-    
     # Handle both old (just paths) and new (path with metadata) formats
     if path_items and hasattr(path_items[0], 'path'):
         # New format with metadata - use metadata for proper grouping
-        # Create reverse map for unsanitizing
-        reverse_map = {s: o for o, s in Constants.ESCAPE_MAP.items()}
-        
         groups = {}
         for item in path_items:
             metadata = item.metadata
             
             # Get components from metadata (sanitized) and unsanitize them
-            method = metadata.get("Method", "unknown")
-            basis = metadata.get("Basis", "")
-            dispersion = metadata.get("Dispersion", "")
-            solvent = metadata.get("Solvent", "")
-            
-            # Unsanitize the values
-            for s, o in reverse_map.items():
-                method = method.replace(s, o)
-                basis = basis.replace(s, o)
-                dispersion = dispersion.replace(s, o)
-                solvent = solvent.replace(s, o)
+            method = _unsanitize(metadata.get("Method", "unknown"))
+            basis = _unsanitize(metadata.get("Basis", ""))
+            dispersion = _unsanitize(metadata.get("Dispersion", ""))
+            solvent = _unsanitize(metadata.get("Solvent", ""))
             
             # Start building the key with method
             key_parts = [method]
             
             # Add dispersion if it exists and is not "false" or "none"
-            if dispersion and dispersion.lower() not in ["false", "none", ""]:
-                disp_formatted = disp_map.get(dispersion.lower(), dispersion)
+            if dispersion and dispersion.lower() not in _UNSET_DISPERSION:
+                disp_formatted = DISPERSION_LABELS.get(dispersion.lower(), dispersion)
                 key_parts[0] = f"{method}-{disp_formatted}"
             
             # Add basis if it exists
@@ -185,7 +277,7 @@ def group_paths_by_method_basis(path_items: List) -> Dict[str, List]:
                 key_parts.append(basis)
             
             # Add solvent if it exists and is not "none" or empty
-            if solvent and solvent.lower() not in ["none", ""]:
+            if solvent and solvent.lower() not in _UNSET_SOLVENT:
                 key_parts.append(f"({solvent})")
             
             # Join all parts
@@ -201,11 +293,38 @@ def group_paths_by_method_basis(path_items: List) -> Dict[str, List]:
         return groups
 
 
-def print_group_status(group_key: str, path_items: List, system_dir: Path) -> Dict[str, int]:
+def make_path_formatter(system_dir: Path) -> Callable[..., Tuple[str, str]]:
+    """
+    Returns a function mapping an input path below system_dir to its report label
+    (relative path without suffix) and its calculation mode ("OPT" or "SP").
+    The system_dir prefix is resolved once, so each call only slices the path string
+    instead of re-parsing it with Path.relative_to.
+    The mode is taken from the builder metadata when given, and only derived from
+    the "_sp" file suffix for bare paths.
+    """
+    prefix_len = len(os.path.join(os.fspath(system_dir), ""))
+
+    def _format(path: Path, metadata: dict = None) -> Tuple[str, str]:
+        relative = os.path.splitext(os.fspath(path)[prefix_len:])[0]
+        calc_mode = metadata.get("Mode") if metadata else None
+        if calc_mode:
+            mode = calc_mode.upper()
+        else:
+            mode = "SP" if relative.endswith("_sp") else "OPT"
+        return relative, mode
+
+    return _format
+
+
+def print_group_status(group_key: str, path_items: List, system_dir: Path,
+                       dir_listing: Optional[Dict[str, FrozenSet[str]]] = None,
+                       pool: Optional[Executor] = None) -> Dict[str, int]:
     """
     Checks statuses for paths in this group, prints a formatted report including the calculation mode
     (OPT or SP), and returns a summary dictionary of status counts for the group.
     Enhanced to show OPT convergence info when available.
+    A dir_listing from scan_directory_tree is used for existence checks when provided.
+    When a pool is given, the file checks run in it and the report keeps the input order.
     """
     # Handle both old (just paths) and new (path with metadata) formats
     if path_items and hasattr(path_items[0], 'path'):
@@ -217,33 +336,45 @@ def print_group_status(group_key: str, path_items: List, system_dir: Path) -> Di
         paths = path_items
         metadata_list = [None] * len(paths)
     
+    format_path = make_path_formatter(system_dir)
+    # Format every label once, tracking the column width in the same pass
     header_text = "Input File (rel)"
-    max_path_length = max(
-        max(len(str(path.relative_to(system_dir).parent / path.stem)) for path in paths),
-        len(header_text)
-    )
-    # Format string with fixed widths for each column.
-    format_str = f"{{:<{max_path_length}}} | {{:<6}} | {{:<10}} | {{}}"
+    max_path_length = len(header_text)
+    labels = []
+    for path, metadata in zip(paths, metadata_list):
+        label = format_path(path, metadata)
+        labels.append(label)
+        if len(label[0]) > max_path_length:
+            max_path_length = len(label[0])
+    # %-style format with fixed widths for each column, so rows are only rendered if they are logged.
+    row_format = f"%-{max_path_length}s | %-6s | %-10s | %s"
     group_counts: Dict[str, int] = {}
 
     boundary_line = "-" * 60
     summary_logger.info(f"\n{boundary_line}")
     summary_logger.info(f"{' ' * 8}GROUP: {group_key}")
     summary_logger.info(boundary_line)
-    summary_logger.info(format_str.format(header_text, "Mode", "Status", "Details"))
+    summary_logger.info(row_format, header_text, "Mode", "Status", "Details")
     summary_logger.info(boundary_line)
 
-    for path, metadata in zip(paths, metadata_list):
-        relative_path = path.relative_to(system_dir).parent / path.stem
-        mode = "SP" if path.stem.endswith("_sp") else "OPT"
-        if path.exists():
+    def check_path(path: Path, metadata: Optional[dict]) -> Tuple[str, str]:
+        """Return the (status, details) of a single input."""
+        input_dir, input_name = os.path.split(os.fspath(path))
+        dir_names = dir_listing.get(input_dir) if dir_listing is not None else None
+        input_exists = input_name in dir_names if dir_names is not None else path.exists()
+        if input_exists:
             # Use status checking with metadata for enhanced validation
-            status, details = get_status_for_file(path, metadata)
-        else:
-            status, details = 'absent', 'Input file not found'
+            return get_status_for_file(path, metadata, dir_listing)
+        return 'absent', 'Input file not found'
+
+    results = (pool.map(check_path, paths, metadata_list) if pool is not None
+               else map(check_path, paths, metadata_list))
+    log_rows = summary_logger.isEnabledFor(logging.INFO)
+    for (relative_path, mode), (status, details) in zip(labels, results):
         group_counts[status] = group_counts.get(status, 0) + 1
         # Use summary_logger to ensure uniform formatting.
-        summary_logger.info(format_str.format(str(relative_path), mode, status, details))
+        if log_rows:
+            summary_logger.info(row_format, relative_path, mode, status, details)
 
     summary_logger.info(f"\n{' ' * 4}Summary for {group_key}:")
     for s, count in group_counts.items():
@@ -251,15 +382,18 @@ def print_group_status(group_key: str, path_items: List, system_dir: Path) -> Di
     return group_counts
 
 
-def check_all_statuses(config_manager, system_dir: Path) -> None:
+def check_all_statuses(config_manager, system_dir: Path, max_workers: int = 32) -> None:
     """
     Iterates over expected input paths (grouped by method_basis), checks their statuses on the fly,
     prints a formatted report for each group along with an intermediate summary, and finally prints
     an overall status summary. Enhanced to show OPT convergence info when available.
     
+    Status checks are filesystem-bound, so they run concurrently in a thread pool.
+    
     Args:
         config_manager: ConfigManager instance or raw config dict
         system_dir: Base system directory
+        max_workers: Number of threads used for the status checks
     """
     logging.info(f"Status checking started:")
     # Use metadata for enhanced status reporting
@@ -270,11 +404,14 @@ def check_all_statuses(config_manager, system_dir: Path) -> None:
 
     groups = group_paths_by_method_basis(path_items)
     overall_counts: Dict[str, int] = {}
+    # List the whole calculation tree once instead of probing each expected file
+    dir_listing = scan_directory_tree(system_dir)
 
-    for group_key, group_items in groups.items():
-        group_counts = print_group_status(group_key, group_items, system_dir)
-        for s, count in group_counts.items():
-            overall_counts[s] = overall_counts.get(s, 0) + count
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        for group_key, group_items in groups.items():
+            group_counts = print_group_status(group_key, group_items, system_dir, dir_listing, pool)
+            for s, count in group_counts.items():
+                overall_counts[s] = overall_counts.get(s, 0) + count
 
     # Print overall summary with a boundary block.
     boundary_line = "=" * 60
@@ -5,20 +5,101 @@ Provides basic file I/O operations and a helper function to sanitize strings for
 """
 
 import logging
+import os
+import sys
+import threading
+from collections import OrderedDict
+from functools import lru_cache
 from pathlib import Path
+from typing import Tuple, Union
 # import re
 from PyA3EDA.core.constants import Constants
 
-def read_text(file_path: Path) -> str:
+# Size of the trailing chunk read by read_text_tail
+TAIL_BYTES = 64 * 1024
+
+# Total size of the file contents kept by read_text_cached, keyed by (path, mtime_ns, size)
+TEXT_CACHE_BYTES = 64 * 1024 * 1024
+_text_cache: "OrderedDict[Tuple[str, int, int], str]" = OrderedDict()
+_text_cache_bytes = 0
+_text_cache_lock = threading.Lock()
+
+def _decode_text(data: bytes) -> str:
+    """Decodes file bytes as UTF-8, normalizing line endings only when carriage returns are present."""
+    text = data.decode("utf-8", errors="ignore")
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text.rstrip()
+
+def read_text(file_path: Union[str, Path]) -> str:
     """
     Reads and returns the text of the given file.
+    Accepts either a Path or a plain string path.
+    The file is read as bytes and decoded in one go; line endings are only
+    normalized to "\n" when the text actually contains carriage returns.
+    """
+    try:
+        with open(file_path, "rb") as f:
+            return _decode_text(f.read())
+    except Exception as e:
+        logging.error(f"Error reading file '{file_path}': {e}")
+        return ""
+
+def read_text_tail(file_path: Union[str, Path], nbytes: int = TAIL_BYTES) -> str:
+    """
+    Reads and returns the text of the last nbytes of the given file (all of it if smaller).
+    Used to look for markers printed at the end of an output file without loading the whole file.
     """
     try:
-        return file_path.read_text(encoding="utf-8", errors="ignore").rstrip()
+        with open(file_path, "rb") as f:
+            size = f.seek(0, os.SEEK_END)
+            f.seek(max(0, size - nbytes))
+            return _decode_text(f.read())
     except Exception as e:
         logging.error(f"Error reading file '{file_path}': {e}")
         return ""
 
+def read_text_cached(file_path: Union[str, Path]) -> str:
+    """
+    Same as read_text, but returns the previously read content while the file's
+    modification time and size are unchanged. Used where the same output file is
+    read several times during extraction (data, coordinates, SP corrections).
+    The cache is bounded by the total size of the cached files (TEXT_CACHE_BYTES),
+    evicting the least recently used files first.
+    """
+    global _text_cache_bytes
+    try:
+        stat = os.stat(file_path)
+    except OSError as e:
+        logging.error(f"Error reading file '{file_path}': {e}")
+        return ""
+    key = (os.fspath(file_path), stat.st_mtime_ns, stat.st_size)
+    with _text_cache_lock:
+        text = _text_cache.get(key)
+        if text is not None:
+            _text_cache.move_to_end(key)
+            return text
+    text = read_text(file_path)
+    if stat.st_size <= TEXT_CACHE_BYTES:
+        with _text_cache_lock:
+            if key not in _text_cache:
+                _text_cache[key] = text
+                _text_cache_bytes += stat.st_size
+                while _text_cache_bytes > TEXT_CACHE_BYTES:
+                    (_, _, size), _ = _text_cache.popitem(last=False)
+                    _text_cache_bytes -= size
+    return text
+
+@lru_cache(maxsize=None)
+def read_template(file_path: Union[str, Path]) -> str:
+    """
+    Same as read_text, memoized per path. Template files are read for every generated
+    input but do not change during a run; generate_all_inputs clears the cache
+    (read_template.cache_clear()) and preloads all templates at the start of each run,
+    so the cache is unbounded to keep every template resident.
+    """
+    return read_text(file_path)
+
 def write_text(file_path: Path, content: str) -> bool:
     """
     Writes content to a file and returns True if successful.
@@ -30,13 +111,15 @@ def write_text(file_path: Path, content: str) -> bool:
         logging.error(f"Error writing file '{file_path}': {e}")
         return False
 
+@lru_cache(maxsize=1024)
 def sanitize_filename(name: str) -> str:
     """
     Sanitizes a string to be safe for use as a filename.
     Replaces characters based on the Constants.ESCAPE_MAP.
+    Results are memoized and interned, since the same method/basis/species names are
+    sanitized repeatedly and end up as keys and values in every file's metadata.
     """
-    for old, new in Constants.ESCAPE_MAP.items():
-        name = name.replace(old, new)
+    name = name.translate(Constants.ESCAPE_TRANSLATION)
     # Optionally, remove any remaining non-alphanumeric characters.
     # name = re.sub(r'[^A-Za-z0-9\-_]+', '_', name)
-    return name.strip('_')
+    return sys.intern(name.strip('_'))
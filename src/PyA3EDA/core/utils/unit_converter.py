@@ -5,85 +5,77 @@ Provides functions for converting between different energy units in computationa
 """
 
 import logging
+from typing import Any, Callable, Dict, Optional, Tuple
 from PyA3EDA.core.constants import Constants
 
+# Map of accepted (lowercase) unit spellings to their canonical unit group
+_UNIT_GROUPS: Dict[str, str] = {
+    "hartree": "hartree", "ha": "hartree", "a.u.": "hartree",
+    "kcal/mol": "kcal/mol",
+    "kj/mol": "kj/mol",
+    "j/mol": "j/mol",
+    "cal/mol.k": "cal/mol.k",
+    "kcal/mol.k": "kcal/mol.k",
+    "atm": "atm",
+    "pa": "pa", "pascal": "pa",
+}
+
+# Conversion functions keyed by (source group, target group)
+_CONVERSIONS: Dict[Tuple[str, str], Callable[[Any], Any]] = {
+    # Hartree <-> kcal/mol
+    ("hartree", "kcal/mol"): lambda v: v * Constants.HARTREE_TO_KCALMOL,
+    ("kcal/mol", "hartree"): lambda v: v / Constants.HARTREE_TO_KCALMOL,
+    # Hartree <-> kJ/mol
+    ("hartree", "kj/mol"): lambda v: v * Constants.HARTREE_TO_KJMOL,
+    ("kj/mol", "hartree"): lambda v: v * Constants.KJMOL_TO_HARTREE,  # Conversion factor for BSSE/eda correction
+    # kJ/mol <-> kcal/mol
+    ("kj/mol", "kcal/mol"): lambda v: v * Constants.KJMOL_TO_HARTREE * Constants.HARTREE_TO_KCALMOL,  # Conversion factor for BSSE/eda correction
+    ("kcal/mol", "kj/mol"): lambda v: v / Constants.KJMOL_TO_KCALMOL,
+    # cal/mol.K to kcal/mol.K (for entropy)
+    ("cal/mol.k", "kcal/mol.k"): lambda v: v * Constants.TO_KILO,
+    # J/mol to kcal/mol
+    ("j/mol", "kcal/mol"): lambda v: v * Constants.TO_KILO * Constants.KJMOL_TO_KCALMOL,
+    # atm <-> Pa
+    ("atm", "pa"): lambda v: v * Constants.ATM_TO_PA,
+    ("pa", "atm"): lambda v: v / Constants.ATM_TO_PA,
+}
+
+
+def _identity(value: Any) -> Any:
+    return value
+
+
+def _resolve_conversion(unit: str, target_unit: str) -> Optional[Callable[[Any], Any]]:
+    """Return the conversion function for a unit pair, or None if it is unknown."""
+    source = _UNIT_GROUPS.get(unit.lower())
+    target = _UNIT_GROUPS.get(target_unit.lower())
+
+    # Source and target are equivalent (same unit group)
+    if source is not None and source == target:
+        return _identity
+
+    return _CONVERSIONS.get((source, target))
+
+
 def convert_unit(value: float, unit: str, target_unit: str = "kcal/mol") -> float:
     """
     Convert energy value from source unit to target unit.
-    
+
     Args:
         value: The numerical value to convert
         unit: The original unit of the value
         target_unit: The desired output unit
-        
+
     Returns:
         The converted value in target units
     """
-    # Normalize unit names for comparison
-    unit_lower = unit.lower()
-    target_lower = target_unit.lower()
-    
-    # Define equivalent unit groups
-    hartree_units = {"hartree", "ha", "a.u."}
-    kcalmol_units = {"kcal/mol"}
-    kjmol_units = {"kj/mol"}
-    jmol_units = {"j/mol"}
-    calmolkelvin_units = {"cal/mol.k"}
-    kcalmolkelvin_units = {"kcal/mol.k"}
-    atm_units = {"atm"}
-    pa_units = {"pa", "pascal"}
-    
-    # Check if source and target are equivalent (same unit group)
-    if ((unit_lower in hartree_units and target_lower in hartree_units) or
-        (unit_lower in kcalmol_units and target_lower in kcalmol_units) or
-        (unit_lower in kjmol_units and target_lower in kjmol_units) or
-        (unit_lower in jmol_units and target_lower in jmol_units) or
-        (unit_lower in calmolkelvin_units and target_lower in calmolkelvin_units) or
-        (unit_lower in kcalmolkelvin_units and target_lower in kcalmolkelvin_units) or
-        (unit_lower in atm_units and target_lower in atm_units) or
-        (unit_lower in pa_units and target_lower in pa_units)):
+    # Identity conversion: skip unit normalization entirely
+    if unit is target_unit or unit == target_unit:
         return value
-    
-    # Handle Hartree to kcal/mol conversion
-    if unit_lower in hartree_units and target_lower in kcalmol_units:
-        return value * Constants.HARTREE_TO_KCALMOL
-    
-    # Handle kcal/mol to Hartree conversion
-    if unit_lower in kcalmol_units and target_lower in hartree_units:
-        return value / Constants.HARTREE_TO_KCALMOL
-    
-    # Handle Hartree to kJ/mol conversion
-    if unit_lower in hartree_units and target_lower in kjmol_units:
-        return value * Constants.HARTREE_TO_KJMOL
 
-    # Handle kJ/mol to Hartree conversion
-    if unit_lower in kjmol_units and target_lower in hartree_units:
-        return value * Constants.KJMOL_TO_HARTREE # Conversion factor for BSSE/eda correction
-
-    # Handle kJ/mol to kcal/mol conversion
-    if unit_lower in kjmol_units and target_lower in kcalmol_units:
-        return value * Constants.KJMOL_TO_HARTREE * Constants.HARTREE_TO_KCALMOL # Conversion factor for BSSE/eda correction
-    
-    # Handle kcal/mol to kJ/mol conversion
-    if unit_lower in kcalmol_units and target_lower in kjmol_units:
-        return value / Constants.KJMOL_TO_KCALMOL
-    
-    # Handle cal/mol to kcal/mol conversion (for entropy)
-    if unit_lower in calmolkelvin_units and target_lower in kcalmolkelvin_units:
-        return value * Constants.TO_KILO
-    
-    # Handle J/mol to kcal/mol conversion
-    if unit_lower in jmol_units and target_lower in kcalmol_units:
-        return value * Constants.TO_KILO * Constants.KJMOL_TO_KCALMOL
-    
-    # Handle atm to Pa conversion
-    if unit_lower in atm_units and target_lower in pa_units:
-        return value * Constants.ATM_TO_PA
-    
-    # Handle Pa to atm conversion
-    if unit_lower in pa_units and target_lower in atm_units:
-        return value / Constants.ATM_TO_PA
-
-    # If we don't know how to convert, log warning and return original
-    logging.warning(f"Unrecognized unit conversion: {unit} to {target_unit}. Returning original value.")
-    return value
\ No newline at end of file
+    conversion = _resolve_conversion(unit, target_unit)
+    if conversion is None:
+        # If we don't know how to convert, log warning and return original
+        logging.warning(f"Unrecognized unit conversion: {unit} to {target_unit}. Returning original value.")
+        return value
+    return conversion(value)
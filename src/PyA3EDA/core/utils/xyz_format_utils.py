@@ -4,6 +4,9 @@ XYZ Format Utilities
 Centralized formatting functions for XYZ coordinate data.
 """
 
+import io
+
+
 def format_xyz_coordinate_line(element: str, x: float, y: float, z: float) -> str:
     """
     Format a single coordinate line for XYZ output.
@@ -34,10 +37,9 @@ def format_xyz_content(n_atoms: int, charge: int, multiplicity: int, atoms: list
     if not atoms:
         return ""
     
-    content_lines = [
-        str(n_atoms),
-        f"{charge} {multiplicity}"
-    ]
-    content_lines.extend(atoms)
+    # Write header and atom lines in a single pass into one buffer
+    buffer = io.StringIO()
+    buffer.write(f"{n_atoms}\n{charge} {multiplicity}\n")
+    buffer.writelines(f"{atom}\n" for atom in atoms)
     
-    return "\n".join(content_lines) + "\n"
+    return buffer.getvalue()
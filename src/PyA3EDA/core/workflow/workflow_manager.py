@@ -5,6 +5,7 @@ Orchestrates the workflow for PyA3EDA.
 """
 
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from PyA3EDA.core.config.config_manager import ConfigManager
 
@@ -65,9 +66,14 @@ class WorkflowManager:
         # Extract-Transform-Load pipeline
         raw_data = extract_all_data(self.config_manager, self.system_dir, criteria)
         processed_data = process_all_profiles(raw_data)
-        export_all_data(processed_data, self.system_dir)
         
         # Generate plots by default (can be disabled with --no-plots)
         generate_plots = not getattr(self.args, 'no_plots', False) if self.args else True
-        if generate_plots:
-            plot_all_profiles(processed_data, self.system_dir)
+        
+        # Both steps only read the in-memory processed data, so the CSV/XYZ export
+        # runs in a background thread while the plots are rendered
+        with ThreadPoolExecutor(max_workers=1) as export_pool:
+            export_future = export_pool.submit(export_all_data, processed_data, self.system_dir)
+            if generate_plots:
+                plot_all_profiles(processed_data, self.system_dir)
+            export_future.result()